@@ -1,13 +1,24 @@
+import gc
 import sys
 import time
 import math
-import json
 import os
+import mmap
+import socket
+import statistics
+import struct
 import tkinter as tk
 from tkinter import ttk, messagebox
 from enum import Enum, auto
+from collections import deque, namedtuple
+from functools import partial
 
-from transitions import Machine
+
+try:
+    # Optional: faster JSONL parsing when orjson is installed
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 try:
     import monkey_shared
@@ -20,6 +31,41 @@ except ImportError:
 REFRESH_RATE_HZ = monkey_shared.REFRESH_RATE_HZ
 WIN_BLANK_DURATION_FRAMES = monkey_shared.WIN_BLANK_DURATION_FRAMES
 
+# Command bitmask layout (SharedCommands field order)
+CMD_ROTATE_LEFT = monkey_shared.CMD_ROTATE_LEFT
+CMD_ROTATE_RIGHT = monkey_shared.CMD_ROTATE_RIGHT
+CMD_ZOOM_IN = monkey_shared.CMD_ZOOM_IN
+CMD_ZOOM_OUT = monkey_shared.CMD_ZOOM_OUT
+CMD_CHECK_ALIGNMENT = monkey_shared.CMD_CHECK_ALIGNMENT
+CMD_RESET = monkey_shared.CMD_RESET
+CMD_BLANK_SCREEN = monkey_shared.CMD_BLANK_SCREEN
+CMD_STOP_RENDERING = monkey_shared.CMD_STOP_RENDERING
+CMD_RESUME_RENDERING = monkey_shared.CMD_RESUME_RENDERING
+CMD_ANIMATION_DOOR = monkey_shared.CMD_ANIMATION_DOOR
+# Continuous (held-key) inputs; every other bit is a trigger
+INPUT_BITS = CMD_ROTATE_LEFT | CMD_ROTATE_RIGHT | CMD_ZOOM_IN | CMD_ZOOM_OUT
+BLANK_DURATION_MS = int(WIN_BLANK_DURATION_FRAMES * 1000 / REFRESH_RATE_HZ)
+
+# ─── Shared memory layout ───
+# Segment name, overridable so several game/controller pairs can run side by side
+SHM_NAME = os.environ.get("MONKEY_SHM_NAME", "monkey_game")
+# Abstract socket the game pings once the segment is initialized (ready_socket_name in shared/src/native.rs)
+READY_SOCKET = "\0monkey_shm_%s_ready" % SHM_NAME
+# SharedGameStructure (repr(C), shared/src/lib.rs): seeds, trial config, 4 bytes padding
+# before frame_number, dynamic fields, 3 bytes padding after is_animating.
+GAME_STRUCTURE_FMT = "<3Q3fI12f3I3f7f4xQ5fI2f?3xf"
+# Compiled once, so per-tick reads skip the struct module's format cache lookup
+GAME_STRUCTURE = struct.Struct(GAME_STRUCTURE_FMT)
+GAME_STRUCTURE_OFFSET = monkey_shared.GAME_STRUCTURE_GAME_OFFSET
+if GAME_STRUCTURE.size != monkey_shared.GAME_STRUCTURE_SIZE:
+    print("Error: GAME_STRUCTURE_FMT does not match the SharedGameStructure layout in shared/src/lib.rs.")
+    sys.exit(1)
+# Delay before retrying a failed connection, grown per failure up to the max. Kept short so
+# the controller attaches within a fraction of a second of the game creating the segment.
+RECONNECT_BACKOFF_MIN_S = 0.01
+RECONNECT_BACKOFF_FACTOR = 1.6
+RECONNECT_BACKOFF_MAX_S = 0.25
+
 # UI Colors
 BG_COLOR = "#1e1e1e"
 CARD_COLOR = "#292929"
@@ -31,6 +77,85 @@ TEXT_WARN = "#ffff00"
 TEXT_BAD = "#ff5555"
 TEXT_GOOD = "#00ff88"
 CANVAS_BG = "#222222"
+LAMP_OFF = "#555555"
+
+# Value templates for the monitor tables, %-formatted every tick
+FMT_SECS = "%.2fs"
+FMT_RAD = "%.4f"
+FMT_COSINE = "%.4f"
+FMT_RADIUS = "%.2f"
+FMT_INTENSITY = "%.1e"
+# Real-time state pane, rendered as one text block
+STATE_BLOCK_FMT = (
+    "Frame        %d\n"
+    "Time         " + FMT_SECS + "\n"
+    "Attempts     %d\n"
+    "Alignment    %s\n"
+    "Angle (Rad)  " + FMT_RAD + "\n"
+    "Yaw (Rad)    " + FMT_RAD + "\n"
+    "Animating    %s\n"
+    "Cam Radius   " + FMT_RADIUS + "\n"
+    "FSM State    %s"
+)
+
+# Key bindings as (keysyms, name): inputs are held while the key is down,
+# triggers are set on press and cleared on release.
+INPUT_KEYS = (
+    (("Left",), "rotate_left"),
+    (("Right",), "rotate_right"),
+    (("Up",), "zoom_in"),
+    (("Down",), "zoom_out"),
+)
+TRIGGER_KEYS = (
+    (("space",), "check"),
+    (("r", "R"), "reset"),
+    (("c", "C"), "retry"),
+    (("b", "B"), "blank"),
+    (("p", "P"), "pause"),
+    (("o", "O"), "resume"),
+)
+QUIT_KEYS = ("q", "Q")
+
+# Controller FSM: event -> (source states, destination); None matches any state
+FSM_STATES = ("playing", "won", "animating", "blank")
+FSM_TRANSITIONS = {
+    "win_game": (("playing",), "won"),
+    "start_anim": (("won",), "animating"), # Usually implies win -> anim
+    "start_blank": (("animating",), "blank"),
+    "reset_game": (("blank",), "playing"),
+    # Manual overrides (for robustness)
+    "force_reset": (None, "playing"),
+    "force_anim": (("playing",), "animating"), # If we detect anim in playing (e.g. door opening?)
+}
+# Display label per FSM state, so the monitor doesn't re-derive it every tick
+FSM_LABELS = {name: name.upper() for name in FSM_STATES}
+
+# Input lamps: (label, command bits); rotate and zoom pairs share one lamp
+INDICATOR_LAYOUT = (
+    ("L/R Arrow (Rot)", CMD_ROTATE_LEFT | CMD_ROTATE_RIGHT),
+    ("U/D Arrow (Zoom)", CMD_ZOOM_IN | CMD_ZOOM_OUT),
+    ("Space (Check/Anim)", CMD_CHECK_ALIGNMENT | CMD_ANIMATION_DOOR),
+    ("R (Reset)", CMD_RESET),
+    ("B (Blank)", CMD_BLANK_SCREEN),
+    ("P (Pause)", CMD_STOP_RENDERING),
+    ("O (Resume)", CMD_RESUME_RENDERING),
+)
+
+# Loop period while active (one display frame), and while paused with no input held.
+# Not shorter: the game samples trigger bits once per frame without clearing them, so each
+# written command word must stay up for a full frame or triggers are dropped. Ticks are
+# already phased ahead of the deadline by the measured loop time (LOOP_TIME_*).
+FRAME_PERIOD_MS = 1000.0 / REFRESH_RATE_HZ
+IDLE_POLL_MS = 100
+# Wake this many ms early and spin to the exact deadline (MONKEY_BUSY_WAIT_MS, e.g. 1.0).
+# Off by default: the spin keeps a core busy for that long every frame.
+BUSY_WAIT_MS = float(os.environ.get("MONKEY_BUSY_WAIT_MS", "0"))
+# Ticks fire early by the median recent processing time plus a margin, so the SHM write lands on the deadline
+LOOP_TIME_HISTORY = 32
+LOOP_TIME_MARGIN_MS = 0.5
+# Tk timers fire a bit late; an EWMA (this weight per tick) of that lateness is armed ahead of time.
+# A tick later than a whole frame is a stall (window drag, dialog, suspend), not timer slack, and is left out.
+TIMER_LATE_ALPHA = 0.1
 
 # Default colors from Rust constants (PYRAMID_COLORS: [[f32;4];3])
 DEFAULT_COLORS = [list(face) for face in monkey_shared.PYRAMID_COLORS]
@@ -64,6 +189,8 @@ DEFAULT_STATE = {
     "pyramid_yaw_rad": 0.0,
     "nr_attempts": 0,
     "cosine_alignment": None,
+    "cosine_alignment_threshold": monkey_shared.COSINE_ALIGNMENT_TO_WIN,
+    "current_angle": 0.0,
     "is_animating": False,
     "has_won": False,
     "win_elapsed_secs": None,
@@ -75,131 +202,323 @@ DEFAULT_STATE = {
     "target_door": 0,
 }
 
-def load_trials(trials_path="trials.jsonl"):
-    """Load trials from JSONL file."""
+def parse_array(values, cast, shape):
+    """Coerce a (possibly nested) list to `cast` and check its shape, e.g. (3, 4) for colors."""
+    if len(values) != shape[0]:
+        raise ValueError(f"expected {shape[0]} entries, got {values!r}")
+    if len(shape) == 1:
+        return [cast(x) for x in values]
+    return [parse_array(row, cast, shape[1:]) for row in values]
+
+
+# One trial, fields in the argument order of SharedMemory.write_reset_config
+Trial = namedtuple("Trial", DEFAULT_CONFIG)
+
+# Per-field coercion applied once at load, so resets pass trial values through unconverted.
+# Angles stay in radians end to end (start_orient, like the Rust side).
+TRIAL_PARSERS = {
+    "decoration_seeds": partial(parse_array, cast=int, shape=(3,)),
+    "base_radius": float,
+    "height": float,
+    "start_orient": float,
+    "target_door": int,
+    "colors": partial(parse_array, cast=float, shape=(3, 4)),
+    "decorations_count": partial(parse_array, cast=int, shape=(3,)),
+    "decorations_size": partial(parse_array, cast=float, shape=(3,)),
+    "cosine_alignment_threshold": float,
+    "door_anim_fade_out": float,
+    "door_anim_stay_open": float,
+    "door_anim_fade_in": float,
+    "main_spotlight_intensity": float,
+    "max_spotlight_intensity": float,
+    "ambient_brightness": float,
+}
+
+# Trial fields that must be present in every line; all others default to DEFAULT_CONFIG
+REQUIRED_TRIAL_KEYS = ("base_radius", "height", "start_orient", "target_door", "colors")
+
+# Binary trial record (see convert_trials), fields in Trial order: seeds, shape, door, colors,
+# decorations, threshold, door animation timings, lighting
+TRIAL_FMT = "<3Q3fI12f3I3f7f"
+TRIAL_STRUCT = struct.Struct(TRIAL_FMT)
+TRIAL_SIZE = TRIAL_STRUCT.size
+# File header: magic, the TRIAL_FMT the records were packed with, record count. A file written
+# with another layout is rejected instead of being misread.
+TRIAL_MAGIC = b"MKTRIALS"
+TRIAL_HEADER = struct.Struct("<8s32sI")
+F32 = struct.Struct("<f")
+
+# Trial files are looked up in the repository root first, then in the current directory
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def shortest_f32(x):
+    """Shortest decimal float that packs to the same f32 as x, an f32 widened to a Python float."""
+    for digits in range(6, 9):
+        y = float("%.*g" % (digits, x))
+        if F32.unpack(F32.pack(y))[0] == x:
+            return y
+    return x
+
+
+def read_trials_jsonl(trial_file):
+    """Parse and validate a JSONL trial file, one Trial per non-empty line."""
     trials = []
-    # Try relative to script directory first
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    parent_dir = os.path.dirname(script_dir)
-    trial_file = os.path.join(parent_dir, trials_path)
+    with open(trial_file, 'rb') as f:
+        for line in f:
+            if line.strip():
+                t = json_loads(line)
+                missing = [k for k in REQUIRED_TRIAL_KEYS if k not in t]
+                if missing:
+                    raise KeyError(f"trial is missing {missing}")
+                trials.append(Trial._make(
+                    TRIAL_PARSERS[k](t.get(k, v)) for k, v in DEFAULT_CONFIG.items()
+                ))
+    return trials
+
+
+class TrialFile:
+    """Read-only sequence of trials backed by a mapped binary file (TRIAL_HEADER, then TRIAL_FMT records).
+    Trials are unpacked on access, so loading costs nothing per trial."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < TRIAL_HEADER.size:
+                raise ValueError(f"{path} is too short for a trial file header")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, fmt, n = TRIAL_HEADER.unpack_from(self._mmap, 0)
+        if magic != TRIAL_MAGIC or fmt.rstrip(b"\0") != TRIAL_FMT.encode():
+            raise ValueError(f"{path} was not written with the current trial layout {TRIAL_FMT}")
+        if len(self._mmap) != TRIAL_HEADER.size + n * TRIAL_SIZE:
+            raise ValueError(f"{path} is truncated or corrupt: expected {n} trial records")
+        self._n = n
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, i):
+        if not 0 <= i < self._n:
+            raise IndexError(f"trial index {i} out of range")
+        # Floats come back as f32 (0.8999999761581421); the shortest round-trip form shows as written
+        # and still packs to the identical f32 the game would get from the JSONL trial
+        v = [shortest_f32(x) if type(x) is float else x
+             for x in TRIAL_STRUCT.unpack_from(self._mmap, TRIAL_HEADER.size + i * TRIAL_SIZE)]
+        return Trial(v[0:3], v[3], v[4], v[5], v[6], [v[7:11], v[11:15], v[15:19]],
+                     v[19:22], v[22:25], *v[25:])
+
+
+def convert_trials(jsonl_path, bin_path):
+    """Write a JSONL trial file as packed TRIAL_FMT records, for loading through TrialFile."""
+    trials = read_trials_jsonl(jsonl_path)
+    with open(bin_path, 'wb') as f:
+        f.write(TRIAL_HEADER.pack(TRIAL_MAGIC, TRIAL_FMT.encode(), len(trials)))
+        for t in trials:
+            f.write(TRIAL_STRUCT.pack(
+                *t.decoration_seeds, t.base_radius, t.height, t.start_orient, t.target_door,
+                *(c for face in t.colors for c in face), *t.decorations_count, *t.decorations_size,
+                *t[Trial._fields.index("cosine_alignment_threshold"):],
+            ))
+    print(f"Wrote {len(trials)} trials to {bin_path}")
+
+
+def load_trials(trials_path="trials.jsonl"):
+    """Load trials, preferring an up-to-date binary copy (see convert_trials) over the JSONL file."""
+    trial_file = os.path.join(REPO_DIR, trials_path)
 
     if not os.path.exists(trial_file):
         # Fallback to current directory
         trial_file = trials_path
+    bin_file = os.path.splitext(trial_file)[0] + ".bin"
+
+    trials = None
+    if os.path.exists(bin_file) and (
+        not os.path.exists(trial_file) or os.path.getmtime(bin_file) >= os.path.getmtime(trial_file)
+    ):
+        try:
+            trials = TrialFile(bin_file)
+            trial_file = bin_file
+        except Exception as e:
+            print(f"Ignoring {bin_file}: {e}. Reading {trial_file} instead.")
 
     try:
-        with open(trial_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    t = json.loads(line)
-                    trials.append({
-                        "decoration_seeds": t.get("decoration_seeds", DEFAULT_CONFIG["decoration_seeds"]),
-                        "base_radius": t["base_radius"],
-                        "height": t["height"],
-                        "start_orient": t["start_orient"],
-                        "target_door": t["target_door"],
-                        "colors": t["colors"],
-                        "decorations_count": t.get("decorations_count", DEFAULT_CONFIG["decorations_count"]),
-                        "decorations_size": t.get("decorations_size", DEFAULT_CONFIG["decorations_size"]),
-                        "cosine_alignment_threshold": t.get("cosine_alignment_threshold", DEFAULT_CONFIG["cosine_alignment_threshold"]),
-                        "door_anim_fade_out": t.get("door_anim_fade_out", DEFAULT_CONFIG["door_anim_fade_out"]),
-                        "door_anim_stay_open": t.get("door_anim_stay_open", DEFAULT_CONFIG["door_anim_stay_open"]),
-                        "door_anim_fade_in": t.get("door_anim_fade_in", DEFAULT_CONFIG["door_anim_fade_in"]),
-                        "main_spotlight_intensity": t.get("main_spotlight_intensity", DEFAULT_CONFIG["main_spotlight_intensity"]),
-                        "max_spotlight_intensity": t.get("max_spotlight_intensity", DEFAULT_CONFIG["max_spotlight_intensity"]),
-                        "ambient_brightness": t.get("ambient_brightness", DEFAULT_CONFIG["ambient_brightness"]),
-                    })
+        if trials is None:
+            trials = read_trials_jsonl(trial_file)
+        if not len(trials):
+            raise ValueError("no trials found")
         print(f"Loaded {len(trials)} trials from {trial_file}")
     except Exception as e:
         print(f"Failed to load trials: {e}. Using DEFAULT_CONFIG.")
-        trials = [DEFAULT_CONFIG]
+        trials = [Trial._make(TRIAL_PARSERS[k](v) for k, v in DEFAULT_CONFIG.items())]
     return trials
 
 
 class SharedMemory:
     def __init__(self):
         self.inner = None
+        # Bound write_game_structure of the connected wrapper, resolved once per connection
+        self._write_game_structure = None
+        # Read-only view of the mapped segment, used for zero-copy state reads
+        self._mmap = None
+        self._mv = None
+        # State dict reused across ticks; callers must treat it as read-only
+        self._state_buf = DEFAULT_STATE.copy()
+        # Raw tuple _state_buf was last filled from, None while it holds defaults
+        self.snapshot = None
+        # Reconnect attempts back off exponentially while the segment stays unavailable
+        self._next_retry = 0.0
+        self._backoff = RECONNECT_BACKOFF_MIN_S
         self.connect()
 
     def connect(self):
+        now = time.monotonic()
+        if now < self._next_retry:
+            return
         try:
-            self.inner = monkey_shared.SharedMemoryWrapper("monkey_game")
+            # Map with the stdlib first: a missing file just means the game isn't up yet.
+            # This mapping only serves state reads, writes go through the wrapper below.
+            with open(monkey_shared.shared_memory_path(SHM_NAME), "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), monkey_shared.SHARED_MEMORY_SIZE, access=mmap.ACCESS_READ)
+            self._mv = memoryview(self._mmap)
+            # Attach only: the game owns the segment, creating it here would wipe its live state.
+            # Writes stay in Rust for the atomic ordering the game relies on.
+            self.inner = monkey_shared.SharedMemoryWrapper(SHM_NAME, False)
+            self._write_game_structure = self.inner.write_game_structure
+            self._backoff = RECONNECT_BACKOFF_MIN_S
             print("Connected to shared memory interface.")
         except Exception as exc:
-            print(f"SHM Connection Error: {exc}")
-            self.inner = None
+            if self._backoff == RECONNECT_BACKOFF_MIN_S:
+                # Report once per outage, the retries are silent
+                if isinstance(exc, FileNotFoundError):
+                    print(f"Waiting for the game to create shared memory '{SHM_NAME}'...")
+                else:
+                    print(f"SHM Connection Error: {exc}")
+            self._disconnect()
+            self._next_retry = now + self._backoff
+            self._backoff = min(self._backoff * RECONNECT_BACKOFF_FACTOR, RECONNECT_BACKOFF_MAX_S)
+
+    def connect_now(self):
+        """(Re)attach right away, skipping any pending backoff (e.g. once the game reports ready).
+        The cached snapshot belongs to the previous game session, so it is dropped and the next
+        read repopulates the state dict."""
+        self._next_retry = 0.0
+        self._backoff = RECONNECT_BACKOFF_MIN_S
+        self.snapshot = None
+        if self._mv is None:
+            self.connect()
+
+    def _disconnect(self):
+        self.inner = None
+        self._write_game_structure = None
+        if self._mv is not None:
+            self._mv.release()
+            self._mv = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _fill_state(self, state=None):
+        """Refresh the reused state dict in place and return it."""
+        buf = self._state_buf
+        self.snapshot = None
+        buf.update(DEFAULT_STATE)
+        if isinstance(state, dict):
+            buf.update(state)
+        return buf
 
     def read_game_state(self):
-        if not self.inner:
+        """Unpack the game-written structure straight from the mapped segment."""
+        if self._mv is None:
             self.connect()
-            if not self.inner:
-                return DEFAULT_STATE.copy()
+            if self._mv is None:
+                return self._fill_state()
         try:
-            state = self.inner.read_game_structure()
-            data = DEFAULT_STATE.copy()
-            if isinstance(state, dict):
-                data.update(state)
-            return data
+            v = GAME_STRUCTURE.unpack_from(self._mv, GAME_STRUCTURE_OFFSET)
         except Exception as exc:
             print(f"SHM Read Error: {exc}")
-            self.inner = None
-            return DEFAULT_STATE.copy()
+            self._disconnect()
+            return self._fill_state()
+
+        buf = self._state_buf
+        if v == self.snapshot:
+            # Game hasn't written since the last read (paused, stalled): dict is already current
+            return buf
+        self.snapshot = v
+        # Fixed vars in trial
+        buf["decoration_seeds"] = v[0:3]
+        buf["base_radius"] = v[3]
+        buf["height"] = v[4]
+        buf["start_orient"] = v[5]
+        buf["target_door"] = v[6]
+        buf["colors"] = (v[7:11], v[11:15], v[15:19])
+        buf["decoration_count"] = v[19:22]
+        buf["decoration_size"] = v[22:25]
+        buf["cosine_alignment_threshold"] = v[25]
+        buf["door_anim_fade_out"] = v[26]
+        buf["door_anim_stay_open"] = v[27]
+        buf["door_anim_fade_in"] = v[28]
+        buf["main_spotlight_intensity"] = v[29]
+        buf["ambient_brightness"] = v[30]
+        buf["max_spotlight_intensity"] = v[31]
+        # Dynamic vars in trial
+        buf["frame_number"] = v[32]
+        buf["elapsed_secs"] = v[33]
+        buf["camera_radius"] = v[34]
+        buf["camera_position"] = v[35:38]
+        buf["nr_attempts"] = v[38]
+        buf["cosine_alignment"] = v[39]
+        buf["current_angle"] = v[40]
+        buf["is_animating"] = v[41]
+        buf["win_elapsed_secs"] = v[42]
+        return buf
 
-    def write_commands(self, rotate_left, rotate_right, zoom_in, zoom_out, check, reset, blank_screen=False, stop_rendering=False, resume_rendering=False, animation_door=False):
+    def write_commands(self, mask):
+        """Write all command flags at once, bit layout given by the CMD_* constants.
+        Returns whether the mask reached the game."""
         if not self.inner:
             self.connect()
             if not self.inner:
-                return
+                return False
         try:
-            self.inner.write_commands(
-                bool(rotate_left),
-                bool(rotate_right),
-                bool(zoom_in),
-                bool(zoom_out),
-                bool(check),
-                bool(reset),
-                bool(blank_screen),
-                bool(stop_rendering),
-                bool(resume_rendering),
-                bool(animation_door)
-            )
+            self.inner.write_command_bits(mask)
         except Exception as exc:
             print(f"SHM Write Error: {exc}")
-            self.inner = None
+            self._disconnect()
+            return False
+        return True
 
     def write_reset_config(self, decoration_seeds, base_radius, height, start_orient, target_door, colors,
                            decorations_count, decorations_size,
                            cosine_alignment_threshold,
                            door_anim_fade_out, door_anim_stay_open, door_anim_fade_in,
                            main_spotlight_intensity, max_spotlight_intensity, ambient_brightness):
-        """Write config to shared memory. decorations_count: [u32;3], decorations_size: [f32;3]."""
+        """Write config to shared memory. decorations_count: [u32;3], decorations_size: [f32;3].
+        Arguments are passed through as-is, load_trials() already coerced and validated them."""
         if not self.inner:
             self.connect()
             if not self.inner:
                 return False
         try:
-            self.inner.write_game_structure(
-                [int(x) for x in decoration_seeds],
-                float(base_radius),
-                float(height),
-                float(start_orient),
-                int(target_door),
+            self._write_game_structure(
+                decoration_seeds,
+                base_radius,
+                height,
+                start_orient,
+                target_door,
                 colors,
-                [int(x) for x in decorations_count],
-                [float(x) for x in decorations_size],
-                float(cosine_alignment_threshold),
-                float(door_anim_fade_out),
-                float(door_anim_stay_open),
-                float(door_anim_fade_in),
-                float(main_spotlight_intensity),
-                float(ambient_brightness),
-                float(max_spotlight_intensity),
+                decorations_count,
+                decorations_size,
+                cosine_alignment_threshold,
+                door_anim_fade_out,
+                door_anim_stay_open,
+                door_anim_fade_in,
+                main_spotlight_intensity,
+                ambient_brightness,
+                max_spotlight_intensity,
             )
             return True
         except Exception as exc:
             print(f"SHM Config Error: {exc}")
-            self.inner = None
+            self._disconnect()
             return False
 
 
@@ -210,31 +529,23 @@ class MonkeyGameController(tk.Tk):
         self.geometry("1400x900")
         self.configure(bg=BG_COLOR)
 
-        # Game State FSM (Shadow + Control)
-        # States: playing, won, animating, blank
-        self.states = ['playing', 'won', 'animating', 'blank']
-        self.machine = Machine(model=self, states=self.states, initial='playing')
-        
-        # Transitions
-        self.machine.add_transition('win_game', 'playing', 'won')
-        self.machine.add_transition('start_anim', 'won', 'animating') # Usually implies win -> anim
-        self.machine.add_transition('start_blank', 'animating', 'blank')
-        self.machine.add_transition('reset_game', 'blank', 'playing')
-        
-        # Manual overrides (for robustness)
-        self.machine.add_transition('force_reset', '*', 'playing')
-        self.machine.add_transition('force_anim', 'playing', 'animating') # If we detect anim in playing (e.g. door opening?)
+        # Game State FSM (Shadow + Control), see FSM_TRANSITIONS
+        self.state = 'playing'
 
         self.shm_wrapper = SharedMemory()
         self.inputs = {
             "rotate_left": False, "rotate_right": False,
             "zoom_in": False, "zoom_out": False
         }
+        # Command word most recently written to SHM
+        self.written_mask = 0
         self.triggers = {
             "check": False, "reset": False, 
             "blank": False, "pause": False, "resume": False,
             "animation_door": False, "retry": False
         }
+        # All-False copy, cleared back into self.triggers with one update() per tick
+        self.triggers_cleared = dict(self.triggers)
         
         # Configuration
         self.trials = load_trials()
@@ -242,22 +553,35 @@ class MonkeyGameController(tk.Tk):
         self.color_entries = []
         
         # Automation State
-        self.blank_start_frame = 0
         self.inferred_win = False
         
         # State capture for Pause/Resume
         self.paused_state = None  # Will hold (config, yaw, camera)
         self.is_paused = False
+
+        # Last text shown per Treeview row, to skip redundant widget updates
+        self._last_text = {}
+        self.shown_trial_idx = None
+        # Inputs the whole UI was last refreshed from, see refresh_ui
+        self.ui_key = None
         
         # UI Setup
         self.setup_ui()
         
         # Bindings
-        self.bind_all("<KeyPress>", self.on_key_press, add="+")
-        self.bind_all("<KeyRelease>", self.on_key_release, add="+")
+        self.bind_keys()
+        self.listen_for_game()
         
-        # Loop
-        self.after(16, self.loop)
+        # Loop, ticking on absolute deadlines so the period doesn't drift
+        self._idle = False
+        self._loop_ms = deque(maxlen=LOOP_TIME_HISTORY)
+        self._lead_ms = LOOP_TIME_MARGIN_MS
+        self._tick_start_ms = 0.0
+        self._timer_due_ms = 0.0
+        self._timer_late_ms = 0.0
+        self._trigger_write_ms = 0.0
+        self._next_tick_ms = time.perf_counter() * 1000.0 + FRAME_PERIOD_MS
+        self._after_id = self.arm_loop(time.perf_counter() * 1000.0)
 
     def setup_ui(self):
         # Main Layout: 2 Columns (Left: Controls/Data, Right: FSM)
@@ -294,10 +618,14 @@ class MonkeyGameController(tk.Tk):
         
         # --- State Column ---
         tk.Label(monitor_frame, text="REAL-TIME STATE (Engine)", font=("Courier", 11, "bold"), fg=TEXT_GOOD, bg=CARD_COLOR).grid(row=0, column=1, sticky="w", padx=10, pady=5)
-        self.tree_state = ttk.Treeview(monitor_frame, columns=("Val"), show="tree", height=15)
-        self.tree_state.column("#0", width=180)
-        self.tree_state.column("Val", width=120)
-        self.tree_state.grid(row=1, column=1, sticky="nsew", padx=5, pady=5)
+        # One read-only Text block: a single widget update per refresh instead of one per row
+        self.text_state = tk.Text(monitor_frame, height=15, width=30, bg="#333333", fg="white",
+                                  font=("Courier", 10), relief="flat", highlightthickness=0)
+        self.text_state.grid(row=1, column=1, sticky="nsew", padx=5, pady=5)
+        self.text_state.config(state="disabled")
+        self.state_block = ""
+        # Raw snapshot and FSM state the block was last built from
+        self.state_key = None
         
         # Style
         style = ttk.Style()
@@ -313,6 +641,7 @@ class MonkeyGameController(tk.Tk):
         self.fsm_canvas.pack(fill="both", expand=True, pady=5)
         
         self.fsm_nodes = {}
+        self.highlighted_node = None
         self.fsm_arrows = {}
         self.draw_fsm_layout()
         
@@ -358,10 +687,10 @@ class MonkeyGameController(tk.Tk):
         # Shadow
         self.fsm_canvas.create_oval(x-r+4, y-r+4, x+r+4, y+r+4, fill="#111111", outline="", tags="shadow")
         # Body
-        self.fsm_canvas.create_oval(x-r, y-r, x+r, y+r, fill="#444444", outline="#777777", width=3, tags=(tag, "node", "oval"))
+        oval = self.fsm_canvas.create_oval(x-r, y-r, x+r, y+r, fill="#444444", outline="#777777", width=3, tags=(tag, "node", "oval"))
         # Text
-        self.fsm_canvas.create_text(x, y, text=name.upper(), font=("Courier", 12, "bold"), fill="white", tags=(tag, "node_text", "text"))
-        self.fsm_nodes[name] = tag
+        text = self.fsm_canvas.create_text(x, y, text=name.upper(), font=("Courier", 12, "bold"), fill="white", tags=(tag, "node_text", "text"))
+        self.fsm_nodes[name] = (oval, text)
 
     def draw_arrow(self, p1, p2, label, tag):
         x1, y1 = p1
@@ -377,131 +706,152 @@ class MonkeyGameController(tk.Tk):
         
         if p1 == p2:
             # Self loop
-             self.fsm_canvas.create_arc(x1-50, y1-80, x1+50, y1-20, start=0, extent=180, style="arc", outline="#666666", width=2, tags=(tag, "arrow", "arc"))
+             edge = self.fsm_canvas.create_arc(x1-50, y1-80, x1+50, y1-20, start=0, extent=180, style="arc", outline="#666666", width=2, tags=(tag, "arrow", "arc"))
+             color_opt = "outline"
              midx, midy = x1, y1-90
         else:
-            self.fsm_canvas.create_line(sx, sy, ex, ey, arrow=tk.LAST, fill="#666666", width=2, tags=(tag, "arrow", "line"))
+            edge = self.fsm_canvas.create_line(sx, sy, ex, ey, arrow=tk.LAST, fill="#666666", width=2, tags=(tag, "arrow", "line"))
+            color_opt = "fill"
             midx, midy = (sx+ex)/2, (sy+ey)/2
             
-        self.fsm_canvas.create_text(midx, midy - 10, text=label, font=("Courier", 9), fill="#aaaaaa", tags=(tag, "arrow_text", "text"))
+        text = self.fsm_canvas.create_text(midx, midy - 10, text=label, font=("Courier", 9), fill="#aaaaaa", tags=(tag, "arrow_text", "text"))
+        # Item ids, the option that colors the edge, and whether it is currently highlighted
+        self.fsm_arrows[tag] = [edge, color_opt, text, False]
 
     def highlight_node(self, name):
-        # Reset all nodes
-        self.fsm_canvas.itemconfig("oval", fill="#444444", outline="#777777")
-        self.fsm_canvas.itemconfig("text", fill="white")
-        self.fsm_canvas.itemconfig("arrow_text", fill="#aaaaaa")
-        
-        # Highlight current
-        tag = self.fsm_nodes.get(name)
-        if tag:
-            items = self.fsm_canvas.find_withtag(tag)
-            for item in items:
-                t = self.fsm_canvas.type(item)
-                if t == "oval":
-                    self.fsm_canvas.itemconfig(item, fill=TEXT_ACCENT, outline="white")
-                elif t == "text":
-                     self.fsm_canvas.itemconfig(item, fill="black")
+        # Only the previously and newly highlighted nodes need recoloring
+        if name == self.highlighted_node:
+            return
+        previous = self.fsm_nodes.get(self.highlighted_node)
+        if previous:
+            oval, text = previous
+            self.fsm_canvas.itemconfig(oval, fill="#444444", outline="#777777")
+            self.fsm_canvas.itemconfig(text, fill="white")
+        current = self.fsm_nodes.get(name)
+        if current:
+            oval, text = current
+            self.fsm_canvas.itemconfig(oval, fill=TEXT_ACCENT, outline="white")
+            self.fsm_canvas.itemconfig(text, fill="black")
+        self.highlighted_node = name
 
     def highlight_arrow(self, tag, active=False):
+        arrow = self.fsm_arrows[tag]
+        edge, color_opt, text, shown = arrow
+        # Steady state: the edge already shows this highlight, no canvas calls
+        if active == shown:
+            return
         color = TEXT_WARN if active else "#666666"
         width = 4 if active else 2
-        
-        items = self.fsm_canvas.find_withtag(tag)
-        for item in items:
-            t = self.fsm_canvas.type(item)
-            if t == "line":
-                self.fsm_canvas.itemconfig(item, fill=color, width=width)
-            elif t == "arc":
-                self.fsm_canvas.itemconfig(item, outline=color, width=width)
-            elif t == "text":
-                self.fsm_canvas.itemconfig(item, fill=TEXT_WARN if active else "#aaaaaa")
+        self.fsm_canvas.itemconfig(edge, {color_opt: color, "width": width})
+        self.fsm_canvas.itemconfig(text, fill=TEXT_WARN if active else "#aaaaaa")
+        arrow[3] = active
 
     def create_input_grid(self, parent):
         grid = tk.Frame(parent, bg=CARD_COLOR)
         grid.pack(fill="x", padx=10, pady=10)
-        self.indicators = {}
-        input_layout = [
-            ("L/R Arrow (Rot)", "rotate_left"),
-            ("U/D Arrow (Zoom)", "zoom_in"),
-            ("Space (Check/Anim)", "check"),
-            ("R (Reset)", "reset"),
-            ("B (Blank)", "blank"),
-            ("P (Pause)", "pause"),
-            ("O (Resume)", "resume"),
-        ]
-        
-        for i, (label, key) in enumerate(input_layout):
+        self.indicators = []
+        self.indicator_mask = 0
+        for i, (label, bits) in enumerate(INDICATOR_LAYOUT):
             row = i // 4
             col = i % 4
             f = tk.Frame(grid, bg=CARD_COLOR)
             f.grid(row=row, column=col, sticky="w", padx=10, pady=2)
-            ind = tk.Label(f, text="●", font=("Arial", 14), fg="#555555", bg=CARD_COLOR)
+            ind = tk.Label(f, text="●", font=("Arial", 14), fg=LAMP_OFF, bg=CARD_COLOR)
             ind.pack(side="left")
             lbl = tk.Label(f, text=label, font=("Courier", 10), fg=TEXT_PRIMARY, bg=CARD_COLOR)
             lbl.pack(side="left", padx=2)
-            self.indicators[key] = ind
-            # For zoom/rot pairs, map multiple keys safely or simplify
-            if key == "rotate_left": self.indicators["rotate_right"] = ind # Shared indicator 
-            if key == "zoom_in": self.indicators["zoom_out"] = ind
+            self.indicators.append((bits, ind))
+
+    def update_indicators(self, mask):
+        # Only lamps whose lit state flipped are reconfigured; a shared lamp (rotate/zoom pair)
+        # stays lit when one of its bits hands over to the other
+        if mask == self.indicator_mask:
+            return
+        shown = self.indicator_mask
+        for bits, ind in self.indicators:
+            lit = mask & bits
+            if bool(lit) != bool(shown & bits):
+                ind.config(fg=TEXT_GOOD if lit else LAMP_OFF)
+        self.indicator_mask = mask
 
     def update_data_table(self, state):
         # 1. Update Config Tree (Static-ish)
         # We use DEFAULT_CONFIG or last reset values if we tracked them better, 
         # but DEFAULT_CONFIG is what we have for now plus self.trials logic.
         
-        # Get Current Trial Config
-        trial = self.trials[self.current_trial_index % len(self.trials)]
-        
-        cfg_data = {
-            "Seeds": str(trial.get("decoration_seeds", DEFAULT_CONFIG["decoration_seeds"])),
-            "Target Door": trial.get("target_door"),
-            "Threshold": trial.get("cosine_alignment_threshold", DEFAULT_CONFIG["cosine_alignment_threshold"]),
-            "Decors Count": str(trial.get("decorations_count", DEFAULT_CONFIG["decorations_count"])),
-            "Decors Size": str(trial.get("decorations_size", DEFAULT_CONFIG["decorations_size"])),
-            "Spot Intensity": f"{trial.get('main_spotlight_intensity', DEFAULT_CONFIG['main_spotlight_intensity']):.1e}",
-            "Anim Open": trial.get("door_anim_fade_out"),
-            "Anim Stay": trial.get("door_anim_stay_open"),
-        }
-        
-        # Rebuild or update details? Rebuild is safer for simplicity
-        if not self.tree_config.get_children():
-            for k, v in cfg_data.items():
-                self.tree_config.insert("", "end", iid=k, text=k, values=(str(v),))
-        else:
+        # Get Current Trial Config; the rows only change when the trial does
+        trial_idx = self.current_trial_index % len(self.trials)
+        if trial_idx != self.shown_trial_idx:
+            trial = self.trials[trial_idx]
+            cfg_data = {
+                "Seeds": str(trial.decoration_seeds),
+                "Target Door": trial.target_door,
+                "Threshold": trial.cosine_alignment_threshold,
+                "Decors Count": str(trial.decorations_count),
+                "Decors Size": str(trial.decorations_size),
+                "Spot Intensity": FMT_INTENSITY % trial.main_spotlight_intensity,
+                "Anim Open": trial.door_anim_fade_out,
+                "Anim Stay": trial.door_anim_stay_open,
+            }
             for k, v in cfg_data.items():
-                if self.tree_config.exists(k):
-                    self.tree_config.item(k, values=(str(v),))
+                self.set_tree_value(self.tree_config, k, v)
+            self.shown_trial_idx = trial_idx
 
-        # 2. Update State Tree (Dynamic)
-        align = state.get("cosine_alignment")
-        align_str = f"{align:.4f}" if (align is not None and align <= 1.5) else "N/A"
-        
-        st_data = {
-            "Frame": state.get("frame_number"),
-            "Time": f"{state.get('elapsed_secs', 0.0):.2f}s",
-            "Attempts": state.get("attempts", 0),
-            "Alignment": align_str,
-            "Angle (Rad)": f"{state.get('current_angle', 0.0):.4f}",
-            "Yaw (Rad)": f"{state.get('pyramid_yaw_rad', 0.0):.4f}",
-            "Animating": str(state.get("is_animating", False)),
-            "Cam Radius": f"{state.get('camera_radius', 0.0):.2f}",
-            "FSM State": self.state.upper()
-        }
+        # 2. Update State Tree (Dynamic), skipped outright while the game hasn't written anything new
+        key = (self.shm_wrapper.snapshot, self.state)
+        if key == self.state_key:
+            return
+        self.state_key = key
+        align = state["cosine_alignment"]
+        align_str = FMT_COSINE % align if (align is not None and align <= 1.5) else "N/A"
         
-        if not self.tree_state.get_children():
-            for k, v in st_data.items():
-                self.tree_state.insert("", "end", iid=k, text=k, values=(str(v),))
+        block = STATE_BLOCK_FMT % (
+            state["frame_number"],
+            state["elapsed_secs"],
+            state["nr_attempts"],
+            align_str,
+            state["current_angle"],
+            state["pyramid_yaw_rad"],
+            state["is_animating"],
+            state["camera_radius"],
+            FSM_LABELS[self.state],
+        )
+        if block != self.state_block:
+            text = self.text_state
+            text.config(state="normal")
+            text.replace("1.0", "end", block)
+            text.config(state="disabled")
+            self.state_block = block
+
+    def set_tree_value(self, tree, key, value):
+        # Only touch the widget when the displayed text changed, most rows are stable between frames
+        text = str(value)
+        shown = self._last_text.setdefault(tree, {})
+        if shown.get(key) == text:
+            return
+        if key in shown:
+            tree.item(key, values=(text,))
         else:
-            for k, v in st_data.items():
-                if self.tree_state.exists(k):
-                    self.tree_state.item(k, values=(str(v),))
+            tree.insert("", "end", iid=key, text=key, values=(text,))
+        shown[key] = text
 
     def loop(self):
+        # Lateness against the time the timer was armed for, not the deadline, so the estimate doesn't feed back on itself
+        late = time.perf_counter() * 1000.0 - self._timer_due_ms
+        if late <= FRAME_PERIOD_MS:
+            self._timer_late_ms = max(0.0, self._timer_late_ms + TIMER_LATE_ALPHA * (late - self._timer_late_ms))
+        if BUSY_WAIT_MS:
+            deadline = (self._next_tick_ms - self._lead_ms) / 1000.0
+            while time.perf_counter() < deadline:
+                pass
+        self._tick_start_ms = time.perf_counter() * 1000.0
+
         # 1. Read Game State
+        # Every key is present, read_game_state starts from DEFAULT_STATE
         state = self.shm_wrapper.read_game_state()
-        current_frame = state.get("frame_number", 0)
-        is_animating = state.get("is_animating", False)
-        current_alignment = state.get("cosine_alignment")
+        is_animating = state["is_animating"]
+        current_alignment = state["cosine_alignment"]
+        threshold = state["cosine_alignment_threshold"]
         
         auto_reset = False
         auto_blank = False
@@ -530,15 +880,13 @@ class MonkeyGameController(tk.Tk):
             else:
                  # Just update UI and wait
                  self.process_inputs_and_update_ui(state, auto_stop, auto_resume)
-                 self.after(16, self.loop)
+                 self.schedule_loop()
                  return
 
         # ---------------------------------------------------------
         # NORMAL FSM LOGIC
         # ---------------------------------------------------------
         if self.state == 'playing':
-            threshold = state.get("cosine_alignment_threshold", 0.9)
-            
             # Win Inference Logic (Require Check + Good Alignment)
             if self.triggers["check"]:
                 # User pressed Space
@@ -548,57 +896,31 @@ class MonkeyGameController(tk.Tk):
                 # Check if it counts as a WIN
                 if current_alignment is not None and current_alignment <= 1.5:
                     if current_alignment > threshold:
-                        print(f"Valid Win: {current_alignment:.4f} > {threshold}")
+                        print(f"Valid Win: {current_alignment:.4f} > {threshold:.4f}")
                         self.inferred_win = True
-                        self.win_game() # -> won
+                        self.fire('win_game') # -> won
                     else:
-                        print(f"Check Failed: {current_alignment:.4f} < {threshold}")
+                        print(f"Check Failed: {current_alignment:.4f} < {threshold:.4f}")
                 
         elif self.state == 'won':
             if is_animating:
-                self.start_anim() # -> animating
+                self.fire('start_anim') # -> animating
             else:
                 auto_anim = True # Ensure it starts
 
         elif self.state == 'animating':
             if not is_animating:
                 if self.inferred_win:
-                    self.start_blank() # -> blank
-                    self.blank_start_frame = current_frame
+                    self.fire('start_blank') # -> blank
+                    # One-shot timer ends the blank screen, see finish_blank
+                    self.after(BLANK_DURATION_MS, self.finish_blank)
                     # Prepare next trial
                     self.current_trial_index += 1
-                    trial = self.trials[self.current_trial_index % len(self.trials)]
-                    
-                    # Ensure commands_seq > 0 before writing config (required by Rust guard)
-                    self.shm_wrapper.write_commands(
-                        False, False, False, False,
-                        False, True, False, False, False, False  # reset=True
-                    )
-                    self.shm_wrapper.write_reset_config(
-                        trial.get("decoration_seeds", DEFAULT_CONFIG["decoration_seeds"]), trial["base_radius"], 
-                        trial["height"], trial["start_orient"], trial["target_door"], trial["colors"],
-                        trial.get("decorations_count", DEFAULT_CONFIG["decorations_count"]),
-                        trial.get("decorations_size", DEFAULT_CONFIG["decorations_size"]),
-                        trial.get("cosine_alignment_threshold", DEFAULT_CONFIG["cosine_alignment_threshold"]),
-                        trial.get("door_anim_fade_out", DEFAULT_CONFIG["door_anim_fade_out"]),
-                        trial.get("door_anim_stay_open", DEFAULT_CONFIG["door_anim_stay_open"]),
-                        trial.get("door_anim_fade_in", DEFAULT_CONFIG["door_anim_fade_in"]),
-                        trial.get("main_spotlight_intensity", DEFAULT_CONFIG["main_spotlight_intensity"]),
-                        trial.get("max_spotlight_intensity", DEFAULT_CONFIG["max_spotlight_intensity"]),
-                        trial.get("ambient_brightness", DEFAULT_CONFIG["ambient_brightness"])
-                    )
+                    self.push_trial_config(self.current_trial_index)
                     auto_reset = True
                     auto_blank = True
                 else:
-                    self.force_reset() # -> playing (Animation done, back to game)
-
-        elif self.state == 'blank':
-            if (current_frame - self.blank_start_frame) >= WIN_BLANK_DURATION_FRAMES:
-                auto_blank = True # Toggle OFF (Actually Reset clears it? No, Blank is separate)
-                # Wait, blank command toggles. If we want it OFF, we send it again if active?
-                # Actually reset handles clean slate? 
-                # Let's just send reset.
-                self.reset_game() # -> playing
+                    self.fire('force_reset') # -> playing (Animation done, back to game)
 
         # Apply triggers
         if auto_reset: self.triggers['reset'] = True
@@ -608,72 +930,163 @@ class MonkeyGameController(tk.Tk):
         if auto_anim: self.triggers['animation_door'] = True
 
         self.process_inputs_and_update_ui(state)
-        self.after(16, self.loop)
+        self.schedule_loop()
+
+    def fire(self, event):
+        # Apply an FSM_TRANSITIONS event to self.state
+        sources, dest = FSM_TRANSITIONS[event]
+        if sources is not None and self.state not in sources:
+            raise RuntimeError(f"Can't trigger event {event} from state {self.state}")
+        self.state = dest
+
+    def listen_for_game(self):
+        # Linux only: attach as soon as the game pings READY_SOCKET instead of waiting out the backoff
+        self.ready_sock = None
+        if not sys.platform.startswith("linux"):
+            return
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.bind(READY_SOCKET)
+        except OSError as exc:
+            sock.close()
+            print(f"Readiness socket unavailable ({exc}), relying on reconnect polling.")
+            return
+        sock.setblocking(False)
+        self.ready_sock = sock
+        self.tk.createfilehandler(sock, tk.READABLE, self.on_game_ready)
+
+    def on_game_ready(self, sock, mask):
+        try:
+            while sock.recv(16):
+                pass
+        except BlockingIOError:
+            pass
+        self.shm_wrapper.connect_now()
+        # The game (re)started from scratch: drop the shadow session and send it the current trial
+        self.state = 'playing'
+        self.inferred_win = False
+        self.is_paused = False
+        self.paused_state = None
+        self.written_mask = 0
+        self.triggers.update(self.triggers_cleared)
+        self.triggers["reset"] = True
+        self.push_trial_config(self.current_trial_index, self.input_mask() | CMD_RESET)
+        self.wake_loop()
+
+    def destroy(self):
+        # Release READY_SOCKET so a restarted controller can bind it again
+        if self.ready_sock is not None:
+            self.tk.deletefilehandler(self.ready_sock)
+            self.ready_sock.close()
+            self.ready_sock = None
+        super().destroy()
+
+    def finish_blank(self):
+        # Blank screen timed out: toggle it off and go back to playing
+        if self.state != 'blank':
+            return
+        self.triggers['blank'] = True
+        self.fire('reset_game') # -> playing
+        self.wake_loop()
+
+    def schedule_loop(self):
+        # Nothing changes while paused with no input held, so poll less often. Trigger bits just written
+        # keep the active rate for one more tick, which clears them a frame later instead of an idle poll later.
+        self._idle = (self.is_paused and not any(self.inputs.values()) and not any(self.triggers.values())
+                      and not self.written_mask & ~INPUT_BITS)
+        now = time.perf_counter() * 1000.0
+        # The median shrugs off the odd slow tick (GC, window events) that a mean would chase
+        self._loop_ms.append(now - self._tick_start_ms)
+        self._lead_ms = statistics.median(self._loop_ms) + LOOP_TIME_MARGIN_MS
+        if self._idle:
+            self._next_tick_ms = now + IDLE_POLL_MS
+        else:
+            # Advance from the previous deadline, not from now, so timer lateness doesn't accumulate
+            self._next_tick_ms += FRAME_PERIOD_MS
+            # Trigger bits written this tick must stay up a full game frame (see FRAME_PERIOD_MS)
+            hold_ms = FRAME_PERIOD_MS if self.written_mask & ~INPUT_BITS else 0.0
+            if self._next_tick_ms <= now + hold_ms:
+                # Late tick: resync instead of catching up with back-to-back writes
+                self._next_tick_ms = now + FRAME_PERIOD_MS
+        self._after_id = self.arm_loop(now)
+
+    def arm_loop(self, now):
+        # Tk timers have whole-millisecond resolution; with BUSY_WAIT_MS set, loop() spins off the remainder
+        delay = max(0, int(self._next_tick_ms - self._lead_ms - self._timer_late_ms - now - BUSY_WAIT_MS))
+        if self.written_mask & ~INPUT_BITS:
+            # Whatever the lead, the next write can't replace trigger bits the game hasn't had a frame to sample
+            delay = max(delay, math.ceil(self._trigger_write_ms + FRAME_PERIOD_MS - now))
+        self._timer_due_ms = now + delay
+        return self.after(delay, self.loop)
+
+    def wake_loop(self):
+        # Snap back to the active rate as soon as input arrives
+        if self._idle:
+            self.after_cancel(self._after_id)
+            self._idle = False
+            now = time.perf_counter() * 1000.0
+            self._next_tick_ms = now + FRAME_PERIOD_MS
+            self._after_id = self.arm_loop(now)
 
     def process_inputs_and_update_ui(self, state, f_stop=False, f_resume=False):
         # Write to SHM
-        self.shm_wrapper.write_commands(
-            self.inputs["rotate_left"], self.inputs["rotate_right"],
-            self.inputs["zoom_in"], self.inputs["zoom_out"],
-            self.triggers["check"],
-            self.triggers["reset"],
-            self.triggers["blank"],
-            self.triggers["pause"] or f_stop,
-            self.triggers["resume"] or f_resume,
-            self.triggers["animation_door"]
+        triggers = self.triggers
+        mask = (
+            self.input_mask()
+            | (CMD_CHECK_ALIGNMENT if triggers["check"] else 0)
+            | (CMD_RESET if triggers["reset"] else 0)
+            | (CMD_BLANK_SCREEN if triggers["blank"] else 0)
+            | (CMD_STOP_RENDERING if triggers["pause"] or f_stop else 0)
+            | (CMD_RESUME_RENDERING if triggers["resume"] or f_resume else 0)
+            | (CMD_ANIMATION_DOOR if triggers["animation_door"] else 0)
         )
+        self.shm_wrapper.write_commands(mask)
+        self.written_mask = mask
+        if mask & ~INPUT_BITS:
+            self._trigger_write_ms = time.perf_counter() * 1000.0
         
         # Clear triggers
-        for k in self.triggers: self.triggers[k] = False
+        triggers.update(self.triggers_cleared)
         
         # Update UI
+        self.refresh_ui(mask, state)
+
+    def refresh_ui(self, mask, state):
+        # Everything the UI shows derives from these; when none changed, skip all the per-widget checks
+        key = (mask, self.shm_wrapper.snapshot, self.state, self.current_trial_index)
+        if key == self.ui_key:
+            return
+        self.ui_key = key
+        self.update_indicators(mask)
         self.update_data_table(state)
         self.highlight_node(self.state)
         self.highlight_arrow("edge_win", active=(self.state == 'won'))
 
-    def on_key_release(self, event):
-        key = event.keysym.lower()
-        if key == "left": self.inputs["rotate_left"] = False
-        elif key == "right": self.inputs["rotate_right"] = False
-        elif key == "up": self.inputs["zoom_in"] = False
-        elif key == "down": self.inputs["zoom_out"] = False
-        elif key == "space": self.triggers["check"] = False
-        elif key == "r": self.triggers["reset"] = False
-        elif key == "c": self.triggers["retry"] = False
-        elif key == "b": self.triggers["blank"] = False
-        elif key == "p": self.triggers["pause"] = False
-        elif key == "o": self.triggers["resume"] = False
+    def input_mask(self):
+        # Continuous inputs (held keys) as command bits
+        inputs = self.inputs
+        return (
+            (CMD_ROTATE_LEFT if inputs["rotate_left"] else 0)
+            | (CMD_ROTATE_RIGHT if inputs["rotate_right"] else 0)
+            | (CMD_ZOOM_IN if inputs["zoom_in"] else 0)
+            | (CMD_ZOOM_OUT if inputs["zoom_out"] else 0)
+        )
 
     def trigger_reset_config(self):
         # Pick next trial
-        trial = self.trials[self.current_trial_index % len(self.trials)]
+        idx = self.current_trial_index
         self.current_trial_index += 1
         
-        # Ensure commands_seq > 0 by sending a write_commands first (required by Rust guard)
-        self.shm_wrapper.write_commands(
-            self.inputs["rotate_left"], self.inputs["rotate_right"],
-            self.inputs["zoom_in"], self.inputs["zoom_out"],
-            False, True, False, False, False, False  # reset=True
-        )
-        
         print(f"Sending Reset Config (Trial {self.current_trial_index})")
-        self.shm_wrapper.write_reset_config(
-            trial.get("decoration_seeds", DEFAULT_CONFIG["decoration_seeds"]),
-            trial["base_radius"],
-            trial["height"],
-            trial["start_orient"],
-            trial["target_door"],
-            trial["colors"],
-            trial.get("decorations_count", DEFAULT_CONFIG["decorations_count"]),
-            trial.get("decorations_size", DEFAULT_CONFIG["decorations_size"]),
-            trial.get("cosine_alignment_threshold", DEFAULT_CONFIG["cosine_alignment_threshold"]),
-            trial.get("door_anim_fade_out", DEFAULT_CONFIG["door_anim_fade_out"]),
-            trial.get("door_anim_stay_open", DEFAULT_CONFIG["door_anim_stay_open"]),
-            trial.get("door_anim_fade_in", DEFAULT_CONFIG["door_anim_fade_in"]),
-            trial.get("main_spotlight_intensity", DEFAULT_CONFIG["main_spotlight_intensity"]),
-            trial.get("max_spotlight_intensity", DEFAULT_CONFIG["max_spotlight_intensity"]),
-            trial.get("ambient_brightness", DEFAULT_CONFIG["ambient_brightness"])
-        )
+        self.push_trial_config(idx, self.input_mask() | CMD_RESET)
+
+    def push_trial_config(self, idx, mask=CMD_RESET):
+        trial = self.trials[idx % len(self.trials)]
+        # Ensure commands_seq > 0 before writing config (required by Rust guard)
+        if self.shm_wrapper.write_commands(mask):
+            self.written_mask = mask
+            self._trigger_write_ms = time.perf_counter() * 1000.0
+        self.shm_wrapper.write_reset_config(*trial)
 
     def trigger_retry(self):
         print("Action: RETRY (C) - Resetting to current trial start.")
@@ -697,29 +1110,12 @@ class MonkeyGameController(tk.Tk):
             # User said "pause".
             self.paused_state = {
                 "trial_idx": idx,
-                "yaw": trial["start_orient"], # Reset orientation to initial!
-                "config": trial.copy()
+                "yaw": trial.start_orient, # Reset orientation to initial!
+                "config": trial
             }
             
-            # 4. Ensure commands_seq > 0 before writing config (required by Rust guard)
-            self.shm_wrapper.write_commands(
-                False, False, False, False,
-                False, True, False, False, False, False  # reset=True
-            )
-            # Send Reset Config (Initial Layout)
-            self.shm_wrapper.write_reset_config(
-                trial.get("decoration_seeds", DEFAULT_CONFIG["decoration_seeds"]), trial["base_radius"], 
-                trial["height"], trial["start_orient"], trial["target_door"], trial["colors"],
-                trial.get("decorations_count", DEFAULT_CONFIG["decorations_count"]),
-                trial.get("decorations_size", DEFAULT_CONFIG["decorations_size"]),
-                trial.get("cosine_alignment_threshold", DEFAULT_CONFIG["cosine_alignment_threshold"]),
-                trial.get("door_anim_fade_out", DEFAULT_CONFIG["door_anim_fade_out"]),
-                trial.get("door_anim_stay_open", DEFAULT_CONFIG["door_anim_stay_open"]),
-                trial.get("door_anim_fade_in", DEFAULT_CONFIG["door_anim_fade_in"]),
-                trial.get("main_spotlight_intensity", DEFAULT_CONFIG["main_spotlight_intensity"]),
-                trial.get("max_spotlight_intensity", DEFAULT_CONFIG["max_spotlight_intensity"]),
-                trial.get("ambient_brightness", DEFAULT_CONFIG["ambient_brightness"])
-            )
+            # 4. Send Reset Config (Initial Layout)
+            self.push_trial_config(idx)
             
             # 5. Send Commands: Reset + Blank
             self.triggers["reset"] = True
@@ -749,28 +1145,63 @@ class MonkeyGameController(tk.Tk):
         # Force a write immediately? Or just set trigger.
         print("Retry: Unblanking.")
         self.triggers["blank"] = True 
+        self.wake_loop()
 
-    def on_key_press(self, event):
-        key = event.keysym.lower()
-        if key == "left": self.inputs["rotate_left"] = True
-        elif key == "right": self.inputs["rotate_right"] = True
-        elif key == "up": self.inputs["zoom_in"] = True
-        elif key == "down": self.inputs["zoom_out"] = True
-        elif key == "space": 
-            self.triggers["check"] = True
-            self.triggers["animation_door"] = True
-        elif key == "r": 
-            self.triggers["reset"] = True
-            self.trigger_reset_config() # Send new config once
-        elif key == "c":
-            self.trigger_retry()
-        elif key == "b": self.triggers["blank"] = True
-        elif key == "p": self.triggers["pause"] = True
-        elif key == "o": self.triggers["resume"] = True
-        elif key == "q": self.destroy()
+    def bind_keys(self):
+        # One binding per key, so Tk dispatches each event straight to its handler
+        press_actions = {
+            "check": self.press_check,
+            "reset": self.press_reset,
+            "retry": self.trigger_retry,
+        }
+        for keysyms, name in INPUT_KEYS:
+            self.bind_key(keysyms, partial(self.set_input, name, True), partial(self.set_input, name, False))
+        for keysyms, name in TRIGGER_KEYS:
+            press = press_actions.get(name, partial(self.set_flag, self.triggers, name, True))
+            self.bind_key(keysyms, press, partial(self.set_flag, self.triggers, name, False))
+        self.bind_key(QUIT_KEYS, self.destroy)
+
+    def bind_key(self, keysyms, on_press, on_release=None):
+        def press(event):
+            self.wake_loop()
+            on_press()
+
+        for keysym in keysyms:
+            self.bind_all(f"<KeyPress-{keysym}>", press, add="+")
+            if on_release is not None:
+                self.bind_all(f"<KeyRelease-{keysym}>", lambda event: on_release(), add="+")
+
+    @staticmethod
+    def set_flag(flags, name, value):
+        flags[name] = value
+
+    def set_input(self, name, value):
+        # Held inputs go out on the key event instead of waiting up to a frame for the next tick.
+        # Trigger bits already written are kept, the game must still see them for a full frame.
+        self.inputs[name] = value
+        mask = (self.written_mask & ~INPUT_BITS) | self.input_mask()
+        if mask != self.written_mask and self.shm_wrapper.write_commands(mask):
+            self.written_mask = mask
+
+    def press_check(self):
+        self.triggers["check"] = True
+        self.triggers["animation_door"] = True
+
+    def press_reset(self):
+        self.triggers["reset"] = True
+        self.trigger_reset_config() # Send new config once
 
 if __name__ == "__main__":
-    app = MonkeyGameController()
-    app.mainloop()
+    if sys.argv[1:2] == ["--convert-trials"]:
+        # python controller.py --convert-trials [trials.jsonl [trials.bin]]
+        src = sys.argv[2] if len(sys.argv) > 2 else os.path.join(REPO_DIR, "trials.jsonl")
+        dst = sys.argv[3] if len(sys.argv) > 3 else os.path.splitext(src)[0] + ".bin"
+        convert_trials(src, dst)
+    else:
+        app = MonkeyGameController()
+        # Everything built so far (widgets, trials, tables) lives for the whole session: move it out of
+        # the collector's reach so GC passes during the loop only scan the few per-tick objects
+        gc.freeze()
+        app.mainloop()
 
 
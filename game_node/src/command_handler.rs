@@ -54,14 +54,19 @@ impl Plugin for CommandHandlerPlugin {
 
 #[cfg_attr(target_arch = "wasm32", allow(unused_variables, unused_mut))]
 fn init_shared_memory_system(mut commands: Commands) {
-    let name = "monkey_game";
+    // Overridable so several game/controller pairs can run side by side
+    let name = std::env::var("MONKEY_SHM_NAME").unwrap_or_else(|_| "monkey_game".to_string());
 
     #[cfg(not(target_arch = "wasm32"))]
     {
-        match create_shared_memory(name) {
+        match create_shared_memory(&name) {
             Ok(handle) => {
                 info!("Shared Memory initialized successfully.");
                 commands.insert_resource(SharedMemResource(handle));
+                #[cfg(target_os = "linux")]
+                if let Err(e) = shared::notify_shared_memory_ready(&name) {
+                    debug!("No controller waiting for shared memory: {}", e);
+                }
             }
             Err(e) => {
                 error!("Failed to initialize shared memory: {}", e);
@@ -36,6 +36,18 @@ pub struct SharedCommands {
 }
 
 impl SharedCommands {
+    // Bit of each command in a command bitmask, in field declaration order.
+    pub const ROTATE_LEFT: u16 = 1 << 0;
+    pub const ROTATE_RIGHT: u16 = 1 << 1;
+    pub const ZOOM_IN: u16 = 1 << 2;
+    pub const ZOOM_OUT: u16 = 1 << 3;
+    pub const CHECK_ALIGNMENT: u16 = 1 << 4;
+    pub const RESET: u16 = 1 << 5;
+    pub const BLANK_SCREEN: u16 = 1 << 6;
+    pub const STOP_RENDERING: u16 = 1 << 7;
+    pub const RESUME_RENDERING: u16 = 1 << 8;
+    pub const ANIMATION_DOOR: u16 = 1 << 9;
+
     pub const fn new() -> Self {
         Self {
             rotate_left: AtomicBool::new(false),
@@ -50,6 +62,20 @@ impl SharedCommands {
             animation_door: AtomicBool::new(false),
         }
     }
+
+    /// Store every command flag from a bitmask built from the bit constants above.
+    pub fn store_bits(&self, mask: u16) {
+        self.rotate_left.store(mask & Self::ROTATE_LEFT != 0, Ordering::Relaxed);
+        self.rotate_right.store(mask & Self::ROTATE_RIGHT != 0, Ordering::Relaxed);
+        self.zoom_in.store(mask & Self::ZOOM_IN != 0, Ordering::Relaxed);
+        self.zoom_out.store(mask & Self::ZOOM_OUT != 0, Ordering::Relaxed);
+        self.check_alignment.store(mask & Self::CHECK_ALIGNMENT != 0, Ordering::Relaxed);
+        self.reset.store(mask & Self::RESET != 0, Ordering::Release);
+        self.blank_screen.store(mask & Self::BLANK_SCREEN != 0, Ordering::Relaxed);
+        self.stop_rendering.store(mask & Self::STOP_RENDERING != 0, Ordering::Relaxed);
+        self.resume_rendering.store(mask & Self::RESUME_RENDERING != 0, Ordering::Relaxed);
+        self.animation_door.store(mask & Self::ANIMATION_DOOR != 0, Ordering::Relaxed);
+    }
 }
 
 impl Default for SharedCommands {
@@ -1,10 +1,11 @@
 use crate::SharedMemory;
-use std::fs::{OpenOptions};
+use std::fs::{File, OpenOptions};
 use std::io::Write;
+use std::path::PathBuf;
 use std::sync::Arc;
 
 /// Wrapper for file-based shared memory on native platforms (UNIX).
-/// Location shared data structure: /data/local/tmp/monkey_shm_*
+/// Location shared data structure: see shared_memory_path (/dev/shm/monkey_shm_* on Linux)
 /// Used by both python.rs binding and game_node.
 pub struct NativeSharedMemory {
     ptr: *mut SharedMemory,
@@ -13,7 +14,7 @@ pub struct NativeSharedMemory {
 // Initialize shared memory region (by creating or opening existing)
 impl NativeSharedMemory {
     pub fn new(name: &str) -> std::io::Result<Self> {
-        let path = std::env::temp_dir().join(format!("monkey_shm_{}", name));
+        let path = shared_memory_path(name);
         let size = std::mem::size_of::<SharedMemory>();
         
         let mut file =  OpenOptions::new()
@@ -23,10 +24,40 @@ impl NativeSharedMemory {
                 .truncate(true)
                 .open(&path)?;
 
+        // No sync_all: the segment only needs to be coherent between mappings, never on disk
         let zeroes = vec![0u8; size];
         file.write_all(&zeroes)?;
-        file.sync_all()?;
         
+        let shm = Self::map(&file, size)?;
+        unsafe {
+            std::ptr::write(shm.ptr, SharedMemory::new());
+        }
+
+
+        Ok(shm)
+    }
+
+    // Attach to an existing region as-is, without resetting it (fails if nobody created it yet)
+    pub fn open(name: &str) -> std::io::Result<Self> {
+        let path = shared_memory_path(name);
+        let size = std::mem::size_of::<SharedMemory>();
+
+        let file = OpenOptions::new()
+                .read(true)
+                .write(true)
+                .open(&path)?;
+
+        if file.metadata()?.len() < size as u64 {
+            return Err(std::io::Error::new(
+                std::io::ErrorKind::UnexpectedEof,
+                format!("{} is smaller than the shared memory layout", path.display()),
+            ));
+        }
+
+        Self::map(&file, size)
+    }
+
+    fn map(file: &File, size: usize) -> std::io::Result<Self> {
         #[cfg(unix)]
         let ptr = unsafe {
             use std::os::unix::io::AsRawFd;
@@ -39,13 +70,11 @@ impl NativeSharedMemory {
                 fd,
                 0,
             );
+            if ptr == libc::MAP_FAILED {
+                return Err(std::io::Error::last_os_error());
+            }
             ptr as *mut SharedMemory
         };
-        
-        unsafe {
-            std::ptr::write(ptr, SharedMemory::new());
-        }
-
 
         Ok(Self {ptr})
     }
@@ -76,6 +105,18 @@ impl Drop for NativeSharedMemory {
 unsafe impl Send for NativeSharedMemory {}
 unsafe impl Sync for NativeSharedMemory {}
 
+// Location of the file backing the shared memory segment. Prefer /dev/shm (tmpfs, RAM only)
+// so the pages are never written back to a disk-backed temp dir.
+pub fn shared_memory_path(name: &str) -> PathBuf {
+    let dev_shm = std::path::Path::new("/dev/shm");
+    let dir = if cfg!(target_os = "linux") && dev_shm.is_dir() {
+        dev_shm.to_path_buf()
+    } else {
+        std::env::temp_dir()
+    };
+    dir.join(format!("monkey_shm_{}", name))
+}
+
 // Share ownership of the shaed memory across threads
 pub type SharedMemoryHandle = Arc<NativeSharedMemory>;
 
@@ -83,3 +124,25 @@ pub type SharedMemoryHandle = Arc<NativeSharedMemory>;
 pub fn create_shared_memory(name: &str) -> std::io::Result<SharedMemoryHandle> {
     Ok(Arc::new(NativeSharedMemory::new(name)?))
 }
+
+// Abstract UNIX socket name a waiting controller binds to hear that the segment is ready
+pub fn ready_socket_name(name: &str) -> String {
+    format!("monkey_shm_{}_ready", name)
+}
+
+// Tell a waiting controller the segment is initialized, so it can attach right away.
+// Fails with ConnectionRefused when no controller is listening, which callers can ignore.
+#[cfg(target_os = "linux")]
+pub fn notify_shared_memory_ready(name: &str) -> std::io::Result<()> {
+    use std::os::linux::net::SocketAddrExt;
+    use std::os::unix::net::{SocketAddr, UnixDatagram};
+
+    let addr = SocketAddr::from_abstract_name(ready_socket_name(name))?;
+    UnixDatagram::unbound()?.send_to_addr(b"R", &addr)?;
+    Ok(())
+}
+
+// Open shm created by someone else, keeping its contents
+pub fn open_shared_memory(name: &str) -> std::io::Result<SharedMemoryHandle> {
+    Ok(Arc::new(NativeSharedMemory::open(name)?))
+}
@@ -1,5 +1,5 @@
 //! Python bindings for shared memroy of native.rs
-use crate::{SharedMemoryHandle, create_shared_memory};
+use crate::{SharedCommands, SharedMemory, SharedGameStructure, SharedMemoryHandle, create_shared_memory, open_shared_memory, shared_memory_path};
 use std::sync::atomic::Ordering;
 use pyo3::exceptions::PyValueError;
 use pyo3::{prelude::*};
@@ -14,10 +14,10 @@ struct SharedMemoryWrapper {
 #[pymethods]
 impl SharedMemoryWrapper {
     #[new]
-    #[pyo3(signature = (name))]
-    /// Create (with file name) or open shared memory segment
-    fn new(name: &str) -> PyResult<Self> {
-        let res = create_shared_memory(name);
+    #[pyo3(signature = (name, create=true))]
+    /// Create (with file name) or, with create=False, attach to an existing shared memory segment
+    fn new(name: &str, create: bool) -> PyResult<Self> {
+        let res = if create { create_shared_memory(name) } else { open_shared_memory(name) };
 
         match res {
             Ok(handle) => Ok(SharedMemoryWrapper { inner: handle }),
@@ -123,8 +123,20 @@ impl SharedMemoryWrapper {
         
     }
 
+    /// Write all commands at once from a bitmask (see the CMD_* constants).
+    fn write_command_bits(&mut self, mask: u16) {
+        self.inner.get().commands.store_bits(mask);
+    }
+
     /// Write game structure config fields to shared memory.
     /// Write in controller region
+    /// Arguments are positional-only, so calls skip keyword matching.
+    #[pyo3(signature = (
+        decoration_seeds, base_radius, height, start_orient, target_door, colors,
+        decorations_count, decorations_size, cosine_alignment_threshold,
+        door_anim_fade_out, door_anim_stay_open, door_anim_fade_in,
+        main_spotlight_intensity, ambient_brightness, max_spotlight_intensity, /
+    ))]
     fn write_game_structure(
         &mut self,
         decoration_seeds: [u64; 3],
@@ -186,10 +198,35 @@ impl SharedMemoryWrapper {
 
 }
 
+/// Path of the file backing the named shared memory segment
+#[pyfunction]
+#[pyo3(name = "shared_memory_path")]
+fn py_shared_memory_path(name: &str) -> String {
+    shared_memory_path(name).to_string_lossy().into_owned()
+}
+
 #[pymodule]
 #[pyo3(name = "monkey_shared")]
 fn monkey_shared(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<SharedMemoryWrapper>()?;
+    m.add_function(wrap_pyfunction!(py_shared_memory_path, m)?)?;
+
+    // Layout of the shared segment, so Python can read it through a memoryview.
+    m.add("SHARED_MEMORY_SIZE", std::mem::size_of::<SharedMemory>())?;
+    m.add("GAME_STRUCTURE_SIZE", std::mem::size_of::<SharedGameStructure>())?;
+    m.add("GAME_STRUCTURE_GAME_OFFSET", std::mem::offset_of!(SharedMemory, game_structure_game))?;
+
+    // Command bitmask layout for write_command_bits.
+    m.add("CMD_ROTATE_LEFT", SharedCommands::ROTATE_LEFT)?;
+    m.add("CMD_ROTATE_RIGHT", SharedCommands::ROTATE_RIGHT)?;
+    m.add("CMD_ZOOM_IN", SharedCommands::ZOOM_IN)?;
+    m.add("CMD_ZOOM_OUT", SharedCommands::ZOOM_OUT)?;
+    m.add("CMD_CHECK_ALIGNMENT", SharedCommands::CHECK_ALIGNMENT)?;
+    m.add("CMD_RESET", SharedCommands::RESET)?;
+    m.add("CMD_BLANK_SCREEN", SharedCommands::BLANK_SCREEN)?;
+    m.add("CMD_STOP_RENDERING", SharedCommands::STOP_RENDERING)?;
+    m.add("CMD_RESUME_RENDERING", SharedCommands::RESUME_RENDERING)?;
+    m.add("CMD_ANIMATION_DOOR", SharedCommands::ANIMATION_DOOR)?;
 
     // Export constants from constants.rs so Python can import them directly.
     use crate::constants::game_constants;